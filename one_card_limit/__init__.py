@@ -13,13 +13,18 @@ Main Components:
 
 __version__ = "0.1.0"
 
+from .core import Action, Card, GameConfig, GameTree, HandState, InfoState
+from .strategy import CFRStrategy, Strategy
+from .interface import GameManager, get_human_action
+from .utils import GameLogger
+
 __all__ = [
     # Core
-    "Action", "Card", "Deck", "GameConfig", "HandState", "process_action", "get_valid_actions",
+    "Action", "Card", "GameConfig", "GameTree", "HandState", "InfoState",
     # Strategy
-    "Strategy", "CFRStrategy", "InfoState", "GameNode", "build_game_tree",
+    "Strategy", "CFRStrategy",
     # Interface
     "GameManager", "get_human_action",
     # Utils
     "GameLogger"
-]
\ No newline at end of file
+]
@@ -1,11 +1,20 @@
 """
 Core components of the One Card Limit Poker game.
 """
+from .game_logic import (
+    Action,
+    Card,
+    GameConfig,
+    GameTree,
+    HandState,
+    InfoState,
+)
+
 __all__ = [
     'Action',
     'Card',
-    'Deck',
     'GameConfig',
-    'InfoState',
+    'GameTree',
     'HandState',
+    'InfoState',
 ]
@@ -4,39 +4,81 @@ This module defines the core components and state management for a hand of one-c
 """
 
 # Standard Imports
-from enum import Enum
-from typing import List, Literal, Tuple, Optional
+from enum import IntEnum
+from typing import Dict, FrozenSet, List, Literal, Tuple, Optional
 from dataclasses import dataclass, field
-from copy import deepcopy
-from random import shuffle
+from functools import cached_property, lru_cache, total_ordering
+from random import randrange, sample
+# Third Party Imports
+import numpy as np
 
-class Action(Enum):
-    CHECK = "check"
-    BET = "bet"
-    CALL = "call"
-    RAISE = "raise"
-    FOLD = "fold"
+# Card ranks from lowest to highest, a card's value is its index in this tuple
+CARD_RANKS: Tuple[str, ...] = ("2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A")
+_RANK_INDEX: Dict[str, int] = {rank: val for val, rank in enumerate(CARD_RANKS)}
+
+class Action(IntEnum):
+    CHECK = 0
+    BET = 1
+    CALL = 2
+    RAISE = 3
+    FOLD = 4
     
     def __str__(self) -> Literal['x', 'b', 'c', 'r', 'f']:
-        if self.value == "check":
-            return "x"
-        return self.value[0].lower()
+        return _ACTION_SYMBOLS[self]
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
     
     def __repr__(self)  -> Literal['check', 'bet', 'call', 'raise', 'fold']:
-        return self.value
+        return self.name.lower()
+
+# One letter symbol of each action, indexed by its value
+_ACTION_SYMBOLS: Tuple[str, ...] = ("x", "b", "c", "r", "f")
+# Actions by their symbol or lowercase name
+_ACTION_STRINGS: Dict[str, Action] = {
+    **{symbol: action for symbol, action in zip(_ACTION_SYMBOLS, Action)},
+    **{repr(action): action for action in Action}
+}
+# Byte table mapping each action value to its symbol
+_ACTION_SYMBOL_TABLE = bytes(range(256)).translate(
+    bytes.maketrans(bytes(range(len(_ACTION_SYMBOLS))), "".join(_ACTION_SYMBOLS).encode("ascii"))
+)
 
+@lru_cache(maxsize=None)
+def encode_actions(actions: Tuple[Action, ...]) -> str:
+    """Encodes an action history as its string of action symbols, e.g. "xbr", cached per history."""
+    return bytes(actions).translate(_ACTION_SYMBOL_TABLE).decode("ascii")
+
+@total_ordering
 @dataclass
 class Card:
     """Represents a playing card"""
-    def __init__(self, rank: str | int) -> None:
-        card_ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
+    __slots__ = ("rank", "val")
+    
+    def __new__(cls, rank: str | int) -> "Card":
+        # Cards are flyweights, every card of a rank is the one shared instance
         if isinstance(rank, int):
-            rank = card_ranks[rank]
-        if rank not in card_ranks:
+            if not (0 <= rank < len(CARD_RANKS)):
+                raise ValueError("Invalid card value")
+            return _CARD_POOL[rank]
+        elif rank not in _RANK_INDEX:
             raise ValueError("Invalid card rank")
-        else:
-            self.rank: str = rank
-            self.val: int = card_ranks.index(rank)    
+        return _CARD_POOL[_RANK_INDEX[rank]]
+    
+    def __init__(self, rank: str | int) -> None:
+        # Already initialized by _from_val when the pool was built
+        pass
+    
+    @classmethod
+    def _from_val(cls, val: int) -> "Card":
+        """Builds a new card from a value known to be valid, bypassing the pool."""
+        card = object.__new__(cls)
+        card.rank = CARD_RANKS[val]
+        card.val = val
+        return card
+    
+    def __reduce__(self) -> tuple:
+        return (Card, (self.val,))
         
     def __str__(self) -> str:
         return f"{self.rank}"
@@ -45,22 +87,41 @@ class Card:
         return f"Card({self.rank})"
 
     def __eq__(self, other: object) -> bool:
+        # Pooled cards are equal only to themselves, the value check covers cards built outside the pool
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return False
         return self.val == other.val
     
     def __hash__(self) -> int:
-        return hash(self.rank)
+        return hash(self.val)
+    
+    # Cards are immutable values, copies of a hand share them instead of duplicating them
+    def __copy__(self) -> "Card":
+        return self
+    
+    def __deepcopy__(self, memo: dict) -> "Card":
+        return self
     
-    def __lt__(self, other):
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
         return self.val < other.val
     
-    def __gt__(self, other):
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
         return self.val > other.val
 
-@dataclass
+# Every card from the highest rank down, decks are a prefix of this
+_FULL_DECK: Tuple[Card, ...] = tuple(Card._from_val(val) for val in reversed(range(len(CARD_RANKS))))
+# The shared instance of each card, by value
+_CARD_POOL: Dict[int, Card] = {card.val: card for card in _FULL_DECK}
+
+@dataclass(frozen=True)
 class GameConfig:
-    """Configuration for the game rules."""
+    """Configuration for the game rules, immutable so that derived values can be cached on it."""
     deck_size: int = 4
     max_raises: int = 2
     ante: int = 1
@@ -78,38 +139,69 @@ class GameConfig:
     def __repr__(self) -> str:
         return f"GameConfig(deck_size={self.deck_size}, max_raises={self.max_raises}, ante={self.ante})"
     
+    @cached_property
+    def deck(self) -> Tuple[Card, ...]:
+        """The cards in the deck, from the highest rank down."""
+        return _FULL_DECK[:self.deck_size]
+    
+    @cached_property
+    def deck_set(self) -> FrozenSet[Card]:
+        """The cards in the deck, for membership tests."""
+        return frozenset(self.deck)
+    
+    @cached_property
+    def card_combos(self) -> Tuple[Tuple[Card, Card], ...]:
+        """Every ordered pair of distinct cards in the deck, in the order of `get_card_combo_indices`."""
+        return tuple((_FULL_DECK[i], _FULL_DECK[j]) for i, j in self.get_card_combo_indices().tolist())
+    
     def get_deck(self) -> List[Card]:
         """Generates a deck of cards based on the configuration."""
-        card_ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
-        return [Card(rank) for rank in card_ranks[::-1][:self.deck_size]]
+        return list(self.deck)
     
     def get_all_card_combos(self) -> List[Tuple[Card, Card]]:
         """Generates all possible card combinations for the game."""
-        deck = self.get_deck()
-        combos = []
-        for i in range(len(deck)):
-            for j in range(i + 1, len(deck)):
-                combos.append((deck[i], deck[j]))
-                combos.append((deck[j], deck[i]))
-        return combos
+        return list(self.card_combos)
+    
+    def get_card_values(self) -> np.ndarray:
+        """Returns the values of the cards in the deck as a read-only int8 array, in deck order."""
+        return _card_values(self.deck_size)
+    
+    def get_card_combo_indices(self) -> np.ndarray:
+        """
+        Returns all possible card combinations as a read-only int8 array of deck index pairs, shaped (num_combos, 2),
+        in the same order as `get_all_card_combos`.
+        """
+        return _card_combo_indices(self.deck_size)
+    
+    def build_tree(self) -> "GameTree":
+        """Returns the betting tree for this configuration, built once and shared by every deck size."""
+        return _build_game_tree(self.max_raises, self.ante)
 
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InfoState:
     """
     An information set represents a player's knowledge of the game state.
     It is a tuple of the game rules, the player's position, their card, and the actions taken so far. 
+    Info states are immutable, so `HandState.get_info_state` can share one per key.
     """
     pos: int
     card: Card
-    actions: List[Action]
-    valid_actions: List[Action]
+    actions: Tuple[Action, ...]
+    valid_actions: Tuple[Action, ...]
     result: Optional[int] = None
+    _hash: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Histories are stored as tuples so info states built from lists compare and hash the same
+        object.__setattr__(self, "actions", tuple(self.actions))
+        # The fields can't change after construction, so the hash is computed once here
+        object.__setattr__(self, "_hash", hash((self.pos, self.card, self.actions)))
     
     def __str__(self) -> str:
         encoded = f"{self.card}"
         if len(self.actions) > 0:
-            action_str = "".join([str(action) for action in self.actions])
+            action_str = encode_actions(self.actions)
             encoded += f"-{action_str}"        
         if self.result is not None:            
             encoded += f"-({str(self.result)})"       
@@ -119,23 +211,48 @@ class InfoState:
         return f"InfoState(pos={self.pos}, card={self.card}, actions={self.actions})"
     
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, InfoState):
             return False
         return (self.card == other.card and 
                 self.actions == other.actions)
             
     def __hash__(self) -> int:
-        return hash((self.pos, self.card, tuple(self.actions)))
+        return self._hash
     
+# Valid actions keyed by whether the acting player faces a bet and whether a raise is left
+_VALID_ACTIONS: Dict[Tuple[bool, bool], Tuple[Action, ...]] = {
+    (False, False): (Action.CHECK, Action.BET),
+    (False, True): (Action.CHECK, Action.BET),
+    (True, False): (Action.CALL, Action.FOLD),
+    (True, True): (Action.CALL, Action.FOLD, Action.RAISE),
+}
+# The same valid actions as sets, for membership tests
+_VALID_ACTION_SETS: Dict[Tuple[bool, bool], FrozenSet[Action]] = {
+    key: frozenset(actions) for key, actions in _VALID_ACTIONS.items()
+}
+
+# Every info state handed out by HandState.get_info_state, keyed by raise limit, position, card, actions and result
+_INFO_STATES: Dict[tuple, InfoState] = {}
+
+# Every action history seen so far, so equal histories share one tuple
+_ACTION_HISTORIES: Dict[Tuple[Action, ...], Tuple[Action, ...]] = {}
+
 class HandState:
     """
     Represents the mutable state of a single hand of one card limit poker.
     """
+    __slots__ = (
+        "config", "cards", "actions", "stacks", "acting_pos", "current_bet", "pot", 
+        "raises_made", "is_over", "showdown", "winner_pos", "cards_dealt", "_hash"
+    )
+    
     def __init__(self, config: GameConfig, deal_cards: bool = False) -> None:
         """Initializes hand state with given game configuration."""
         self.config: GameConfig = config
-        self.cards: List[Card] = []
-        self.actions: List[Action] = []
+        self.cards: Tuple[Card, ...] = ()
+        self.actions: Tuple[Action, ...] = ()
         self.stacks: List[int] = [-config.ante,-config.ante]
         self.acting_pos: int = 0
         self.current_bet: int = 0
@@ -145,6 +262,8 @@ class HandState:
         self.showdown: bool = False
         self.winner_pos: int = None
         self.cards_dealt: bool = False
+        # Hash of the config, cards and actions, computed on first use and cleared when they change
+        self._hash: Optional[int] = None
 
         if deal_cards:
             self.deal_cards()
@@ -153,39 +272,46 @@ class HandState:
         """Assigns cards to players if none dealt"""
         if self.cards_dealt:
             raise ValueError("Cards already dealt.")
-        deck = self.config.get_deck()
-        shuffle(deck)
-        self.cards = [deck.pop(), deck.pop()]
+        # Every ordered pair is equally likely, so one draw picks both cards as a shared cached pair
+        card_combos = self.config.card_combos
+        self.cards = card_combos[randrange(len(card_combos))]
         self.cards_dealt = True
+        self._hash = None
     
-    def get_valid_actions(self) -> List[Action]:
+    def get_valid_actions(self) -> Tuple[Action, ...]:
         """
-        Returns a list of valid actions for the acting player of the hand
+        Returns the valid actions for the acting player of the hand
         """
         if not self.cards_dealt:
             raise ValueError("Cards not dealt")
         if self.is_over:
             raise ValueError("Hand is over")
-        else: 
-            if self.current_bet == 0:
-                return [Action.CHECK, Action.BET]
-            else:
-                valid = [Action.CALL, Action.FOLD]
-                if self.raises_made < self.config.max_raises:
-                    valid.append(Action.RAISE)
-                return valid
+        return _VALID_ACTIONS[self.current_bet > 0, self.raises_made < self.config.max_raises]
 
     def get_info_state(self, player_pos: int) -> InfoState:
         if player_pos not in [0,1]:
             raise ValueError("Player position must be 0 or 1")
-        else:
-            return InfoState(
+        
+        # Equal info states are shared, the valid actions also depend on the raise limit
+        result = self.stacks[player_pos] if self.is_over else None
+        key = (self.config.max_raises, player_pos, self.cards[player_pos], self.actions, result)
+        info_state = _INFO_STATES.get(key)
+        if info_state is None:
+            info_state = _INFO_STATES[key] = InfoState(
                 pos = player_pos,
                 card = self.cards[player_pos],
                 actions = self.actions,
-                valid_actions = self.get_valid_actions() if not self.is_over else [],
-                result = self.stacks[player_pos] if self.is_over else None
+                valid_actions = self.get_valid_actions() if not self.is_over else (),
+                result = result
             )
+        return info_state
+    
+    def info_key(self, player_pos: int) -> Tuple[int, Tuple[Action, ...]]:
+        """
+        Key of a player's info state built only from ints, their card value and the action history. 
+        Two info states are equal exactly when their keys are.
+        """
+        return (self.cards[player_pos].val, self.actions)
     
     def process_action(self, action: Action | str) -> None:
         """Updates the hand state based on the action taken by the current player"""
@@ -194,24 +320,16 @@ class HandState:
             raise ValueError("Hand is already over")
         elif not self.cards_dealt:
             raise ValueError("Cards have not been dealt yet")
-        valid = self.get_valid_actions()
-        if action not in valid:
-            raise ValueError(f"Invalid action {action}, valid: {valid}")
+        key = (self.current_bet > 0, self.raises_made < self.config.max_raises)
+        if action not in _VALID_ACTION_SETS[key]:
+            raise ValueError(f"Invalid action {action}, valid: {_VALID_ACTIONS[key]}")
 
         # Record the action in the history
-        self.actions.append(action)
-
-        match action:
-            case Action.CHECK:
-                self._handle_check()
-            case Action.BET:
-                self._handle_bet()
-            case Action.CALL:
-                self._handle_call()
-            case Action.RAISE:
-                self._handle_raise()
-            case Action.FOLD:
-                self._handle_fold()
+        actions = self.actions + (action,)
+        self.actions = _ACTION_HISTORIES.setdefault(actions, actions)
+        self._hash = None
+
+        self._HANDLERS[action](self)
                 
         # Switch to next player
         self.acting_pos = (self.acting_pos + 1) % 2
@@ -254,20 +372,23 @@ class HandState:
         self.is_over = True
         return None
 
+    # Handler of each action, indexed by its value
+    _HANDLERS = (_handle_check, _handle_bet, _handle_call, _handle_raise, _handle_fold)
+
     def _end_hand(self) -> None:
         if not self.is_over:
             raise ValueError("Hand is not over yet")
         # Determine winner
         if self.showdown:
-            self.winner_pos = 0 if self.cards[0] > self.cards[1] else 1
+            self.winner_pos = 0 if self.cards[0].val > self.cards[1].val else 1
 
         # Award pot to winner
         self.stacks[self.winner_pos] += self.pot
     
     def __str__(self) -> str:        
         encoded = "".join([str(card) for card in self.cards])
-        if self.actions != []:
-            action_str = "".join([str(action) for action in self.actions])
+        if self.actions:
+            action_str = encode_actions(self.actions)
             encoded += f"-({action_str})"        
         if self.is_over and self.winner_pos is not None:
             stacks = "".join([str(stack) for stack in self.stacks])            
@@ -275,7 +396,9 @@ class HandState:
         return encoded
 
     def __hash__(self) -> int:
-        return hash(self.config, tuple(self.cards), tuple(self.actions))
+        if self._hash is None:
+            self._hash = hash((self.config, self.cards, self.actions))
+        return self._hash
 
     def __repr__(self) -> str:
         return f"HandState(config={self.config}, cards={self.cards}, actions={self.actions})"
@@ -290,32 +413,48 @@ class HandState:
     # Helper methods for handling actions as strings
     @staticmethod
     def convert_action(action: Action | str) -> Action:
+        if action.__class__ is Action:
+            return action
         if isinstance(action, str):
-            if action in ["x", "b", "c", "r", "f", "x"]:
-                action_map = {
-                    "x": Action.CHECK,
-                    "b": Action.BET,
-                    "c": Action.CALL,
-                    "r": Action.RAISE,
-                    "f": Action.FOLD
-                }
-                action = action_map[action]
-            try:
-                action = Action(action)
-            except ValueError:
+            if action not in _ACTION_STRINGS:
                 raise ValueError(f"Invalid action string: {action}")
+            action = _ACTION_STRINGS[action]
         elif not isinstance(action, Action):
             raise ValueError(f"Action must be of type Action or str, got {type(action)}")
         return action
 
     def clone(self) -> "HandState":
-            return deepcopy(self)
+        """
+        Returns an independent copy of the state. Config, cards and actions are immutable and shared,
+        stacks is the only mutable field and is copied.
+        """
+        state = HandState.__new__(HandState)
+        state.config = self.config
+        state.cards = self.cards
+        state.actions = self.actions
+        state.stacks = self.stacks.copy()
+        state.acting_pos = self.acting_pos
+        state.current_bet = self.current_bet
+        state.pot = self.pot
+        state.raises_made = self.raises_made
+        state.is_over = self.is_over
+        state.showdown = self.showdown
+        state.winner_pos = self.winner_pos
+        state.cards_dealt = self.cards_dealt
+        state._hash = self._hash
+        return state
+    
+    def next_state(self, action: Action | str) -> "HandState":
+        """Returns a copy of the state with one more action applied, leaving this state unchanged."""
+        state = self.clone()
+        state.process_action(action)
+        return state
     
     @classmethod
     def from_cards(cls, config: GameConfig, cards: List[Card|None]) -> "HandState":
         """
         Creates a HandState from given cards. Cards argument must have length 2 and be unique. 
-        If one card is None, it will be randomly drawn from the deck.
+        Any card given as None is randomly drawn from the rest of the deck.
         """
         
         if len(cards) != 2:
@@ -325,21 +464,20 @@ class HandState:
         if isinstance(cards[0], Card) and isinstance(cards[1],Card):
             if cards[0] == cards[1]:
                 raise ValueError("Cards must be unique")
-            elif cards[0] not in config.get_deck() or cards[1] not in config.get_deck():
+            elif cards[0] not in config.deck_set or cards[1] not in config.deck_set:
                 raise ValueError("Cards must be in the deck")
         
-        # One card provided
+        # Missing cards are drawn together from the rest of the deck
         else:
-            deck = config.get_deck()
-            while None in cards:
-                for pos, card in enumerate(cards):
-                    if isinstance(card,Card):
-                        deck.remove(card)
-                        shuffle(deck)
-                        cards[1 - pos] = deck.pop()
+            known = [card for card in cards if card is not None]
+            if any(card not in config.deck_set for card in known):
+                raise ValueError("Cards must be in the deck")
+            deck = [card for card in config.deck if card not in known]
+            drawn = sample(deck, 2 - len(known))
+            cards = [card if card is not None else drawn.pop() for card in cards]
 
         state = cls(config, deal_cards=False)
-        state.cards = cards
+        state.cards = tuple(cards)
         state.cards_dealt = True
         return state
     
@@ -352,38 +490,155 @@ class HandState:
             state.process_action(action)
         return state
 
+@lru_cache(maxsize=None)
+def _card_values(deck_size: int) -> np.ndarray:
+    """Values of the first deck_size cards of the full deck, cached per deck size."""
+    values = np.array([card.val for card in _FULL_DECK[:deck_size]], dtype=np.int8)
+    values.flags.writeable = False
+    return values
+
+@lru_cache(maxsize=None)
+def _card_combo_indices(deck_size: int) -> np.ndarray:
+    """Pairs of distinct deck indices, each pair followed by its swap, cached per deck size."""
+    first, second = np.triu_indices(deck_size, k=1)
+    combos = np.empty((2 * len(first), 2), dtype=np.int8)
+    combos[0::2, 0], combos[0::2, 1] = first, second
+    combos[1::2, 0], combos[1::2, 1] = second, first
+    combos.flags.writeable = False
+    return combos
+
+@dataclass(frozen=True, eq=False)
+class GameTree:
+    """
+    The betting tree of a game configuration, stored as flat read-only arrays indexed by node id.
+    Nodes are in breadth first order with node 0 as the root, so the children of a node are contiguous.
+    The tree does not depend on the cards, which only decide the winner at showdown.
+    """
+    histories: Tuple[Tuple[Action, ...], ...]
+    node_index: Dict[Tuple[Action, ...], int]
+    parent: np.ndarray            # int32, -1 for the root
+    first_child: np.ndarray       # int32, -1 for terminal nodes
+    num_children: np.ndarray      # int32
+    action_id: np.ndarray         # int32, position in Action of the action leading to the node, -1 for the root
+    acting_pos: np.ndarray        # int32
+    is_terminal: np.ndarray       # bool
+    showdown: np.ndarray          # bool
+    terminal_utility: np.ndarray  # float64, OP's payoff after a fold or each player's share of the pot at showdown
+    node_valid_actions: Tuple[Tuple[Action, ...], ...]  # actions available at each node, empty for terminal nodes
+    
+    def __len__(self) -> int:
+        return len(self.histories)
+    
+    def valid_actions(self, node: int) -> Tuple[Action, ...]:
+        """Returns the actions available at a node, in the order of its children."""
+        return self.node_valid_actions[node]
+
+# Actions indexed by their value, the order used by GameTree.action_id
+ACTIONS: Tuple[Action, ...] = tuple(Action)
+
+@lru_cache(maxsize=None)
+def _build_game_tree(max_raises: int, ante: int) -> GameTree:
+    """
+    Enumerates the betting tree breadth first. The tree does not depend on the deck,
+    so it is cached per raise limit and ante and shared by every deck size.
+    """
+    config = GameConfig(deck_size=3, max_raises=max_raises, ante=ante)
+    # Any two cards will do, the tree is only walked for its betting structure
+    states = [HandState.from_cards(config, config.deck[:2])]
+    parent = [-1]
+    action_id = [-1]
+    first_child = []
+    num_children = []
+    node_valid_actions = []
+    
+    for node, state in enumerate(states):
+        if state.is_over:
+            first_child.append(-1)
+            num_children.append(0)
+            node_valid_actions.append(())
+            continue
+        valid = state.get_valid_actions()
+        first_child.append(len(states))
+        num_children.append(len(valid))
+        node_valid_actions.append(valid)
+        for action in valid:
+            child = state.next_state(action)
+            states.append(child)
+            parent.append(node)
+            action_id.append(action)
+    
+    def frozen(values: list, dtype: type) -> np.ndarray:
+        array = np.array(values, dtype=dtype)
+        array.flags.writeable = False
+        return array
+    
+    histories = tuple(state.actions for state in states)
+    return GameTree(
+        histories = histories,
+        node_index = {history: node for node, history in enumerate(histories)},
+        parent = frozen(parent, np.int32),
+        first_child = frozen(first_child, np.int32),
+        num_children = frozen(num_children, np.int32),
+        action_id = frozen(action_id, np.int32),
+        acting_pos = frozen([state.acting_pos for state in states], np.int32),
+        is_terminal = frozen([state.is_over for state in states], bool),
+        showdown = frozen([state.showdown for state in states], bool),
+        terminal_utility = frozen(
+            [(state.pot / 2 if state.showdown else state.stacks[0]) if state.is_over else 0.0 for state in states],
+            np.float64
+        ),
+        node_valid_actions = tuple(node_valid_actions)
+    )
+
 def generate_all_handstates(config: GameConfig) -> List[HandState]:
     """Generate all possible HandState objects for a given GameConfig."""
-    all_handstates = []
-    card_combos = config.get_all_card_combos()  # Generate all possible card combinations
-    
-    for cards in card_combos:
-        # Create the initial HandState with the given card combination
-        initial_state = HandState(config, deal_cards=False)
-        initial_state.cards = list(cards)
-        initial_state.cards_dealt = True
-        
-        # Recursively generate all possible states from the initial state
-        generate_states_recursive(initial_state, all_handstates)
+    card_combos = config.card_combos  # Every possible card combination
     
-    return all_handstates
-
-def generate_states_recursive(state: HandState, all_handstates: List[HandState]) -> None:
-    """Recursively generate all possible HandState objects from a given state."""
+    # The betting tree is the same for every card combination, so it is only played out for the first one
+    first_state = HandState.from_cards(config, card_combos[0])
+    betting_tree: List[HandState] = []
+    _expand_states(first_state, betting_tree)
     
-    if state.is_over:
-        # If the hand is over, add the state to the list and stop recursion
-        all_handstates.append(state.clone())
-        return
+    # Showdown winner of every combination at once, OP wins with the higher card
+    first, second = config.get_card_combo_indices().T
+    card_vals = config.get_card_values()
+    showdown_winners = (card_vals[second] > card_vals[first]).astype(np.int8).tolist()
     
-    # Add the current state to the list
-    all_handstates.append(state.clone())
+    all_handstates = list(betting_tree)
+    for cards, winner_pos in zip(card_combos[1:], showdown_winners[1:]):
+        # The other combinations reuse each state with their cards, only showdowns need a new winner
+        all_handstates.extend(_with_cards(state, cards, winner_pos) for state in betting_tree)
     
-    # Generate new states for each valid action
-    for action in state.get_valid_actions():
-        new_state = state.clone()
-        new_state.process_action(action)
-        generate_states_recursive(new_state, all_handstates)
+    return all_handstates
+
+def _with_cards(state: HandState, cards: Tuple[Card, Card], showdown_winner: int) -> HandState:
+    """Copies a state of the betting tree for different cards, moving the pot of a finished showdown to its winner."""
+    new_state = state.clone()
+    new_state.cards = cards
+    new_state._hash = None
+    if state.is_over and state.showdown and state.winner_pos != showdown_winner:
+        new_state.stacks[state.winner_pos] -= state.pot
+        new_state.stacks[showdown_winner] += state.pot
+        new_state.winner_pos = showdown_winner
+    return new_state
+
+def generate_states_recursive(state: HandState, all_handstates: List[HandState]) -> None:
+    """Generate all possible HandState objects from a given state, walking the tree with an explicit stack."""
+    _expand_states(state.clone(), all_handstates)
+
+def _expand_states(state: HandState, all_handstates: List[HandState]) -> None:
+    """
+    Stores a state owned by the caller and every state reachable from it, depth first in the order 
+    the actions are valid, without cloning the given state a second time.
+    """
+    stack = [state]
+    while stack:
+        state = stack.pop()
+        all_handstates.append(state)
+        if state.is_over:
+            continue
+        # Push children in reverse so they are visited in the order of the valid actions
+        stack.extend(state.next_state(action) for action in reversed(state.get_valid_actions()))
 
 def generate_handstate_infostates(config: GameConfig) -> List[Tuple[HandState, List[InfoState]]]:
     """Generate all HandState objects and their corresponding InfoStates."""
@@ -1,7 +1,10 @@
 """
 User interface components for One Card Limit Poker.
 """
+from .cli import get_human_action
+from .game_manager import GameManager
+
 __all__ = [
     'GameManager',
     'get_human_action',
-]
\ No newline at end of file
+]
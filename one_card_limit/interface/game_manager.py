@@ -18,15 +18,19 @@ class GameManager:
                  initial_stack: int = 100,
                  config: Optional[GameConfig] = None,
                  computer_strategy: Optional[Strategy] = None,
-                 log_enabled: bool = True):
-        """Initialize the game manager with the given configuration and strategy"""
+                 log_enabled: bool = True,
+                 pace: float = 1.0):
+        """
+        Initialize the game manager with the given configuration and strategy.
+        `pace` scales the logger's pauses between events, 0 plays without pauses.
+        """
         self.config = config or GameConfig(deck_size=3, max_raises=2, ante=1)
         self.initial_stack = initial_stack
         self.human_stack = initial_stack
         self.computer_stack = initial_stack
         self.human_pos = 1  # Start human as IP
         self.computer = computer_strategy if computer_strategy else Strategy(self.config)
-        self.logger = GameLogger(initial_stack) if log_enabled else None
+        self.logger = GameLogger(initial_stack, pace) if log_enabled else None
         
     def play_hand(self) -> None:
         """Play a single hand of the game"""
@@ -34,39 +38,45 @@ class GameManager:
         state = HandState(self.config)
         state.deal_cards()
         
-        self.logger.log_hand_start()
+        logger = self.logger
+        if logger:
+            logger.log_hand_start()
         
         # Play until hand is complete
         while not state.is_over:
-            self.logger.log_state(state)
+            if logger:
+                logger.log_state(state)
             action = self._get_action(state)
             state.process_action(action)
-            self.logger.log_action_message(state)
+            if logger:
+                logger.log_action_message(state)
             
         # Update stacks and log results
         self._update_stacks(state)
-        self.logger.log_hand_end(state, self.human_stack, self.computer_stack)
+        if logger:
+            logger.log_hand_end(state, self.human_stack, self.computer_stack)
         
         # Switch positions for next hand
         self.human_pos = (self.human_pos + 1) % 2
     
     def play_session(self, num_hands: int) -> None:
         """Play multiple hands in a session"""
-        self.logger.log_session_start(self.human_stack, self.computer_stack)
+        if self.logger:
+            self.logger.log_session_start(self.human_stack, self.computer_stack)
         
         for i in range(num_hands):
-            self.logger.log_hand_header(i + 1, num_hands, self.human_pos)
+            if self.logger:
+                self.logger.log_hand_header(i + 1, num_hands, self.human_pos)
             self.play_hand()
             
-        self.logger.log_session_end(self.human_stack, self.computer_stack)
+        if self.logger:
+            self.logger.log_session_end(self.human_stack, self.computer_stack)
     
     def _get_action(self, state: HandState) -> Action:
         """Get action from current player (human or computer)"""
         if state.acting_pos == self.human_pos:
             return get_human_action(state)
-        else:
-            action = self.computer.get_action(state)
-            return action
+        return self.computer.get_action(state)
     
     def _update_stacks(self, state: HandState) -> None:
         """Update player stacks based on hand result"""
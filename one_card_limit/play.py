@@ -0,0 +1,79 @@
+# one_card_limit/play.py
+"""
+Command line entry point for One Card Limit Poker, run with `python -m one_card_limit`.
+The `play` command starts a session against the computer and `train` trains and saves a CFR strategy.
+"""
+
+# Standard Imports
+import argparse
+from typing import List, Optional
+# Local Imports
+from .core.game_logic import GameConfig
+from .interface.game_manager import GameManager
+from .strategy.base_strategy import Strategy
+from .strategy.cfr_strategy import CFRStrategy
+
+def play(config: GameConfig, hands: int = 3, pace: float = 0.0) -> None:
+    """Play a session of hands against the trained strategy for the configuration."""
+    # Use factory method to create or load strategy
+    try:
+        computer_strategy = Strategy.load(config)
+    except Exception as e:
+        print(f"Error creating strategy: {e}")
+        computer_strategy = None
+    if computer_strategy is None:
+        print("Falling back to random strategy")
+        computer_strategy = Strategy(config)
+    
+    # Initialize game manager with the loaded strategy
+    game = GameManager(
+        initial_stack=100,
+        config=config,
+        computer_strategy=computer_strategy,
+        log_enabled=True,
+        pace=pace
+    )
+    
+    try:
+        game.play_session(hands)
+    except KeyboardInterrupt:
+        print("\nGame session terminated by user")
+        print(f"Final stacks - Human: {game.human_stack}, Computer: {game.computer_stack}")
+
+def train(config: GameConfig, iterations: int = 10000) -> Strategy:
+    """Train a CFR strategy for the configuration, save it and show its policy."""
+    strategy = CFRStrategy(config).train(iterations)
+    
+    # Save the trained strategy
+    strategy.save()
+    print("Strategy saved")
+    
+    # Show the strategy
+    print("\nSample strategies:")
+    strategy.show_policy()
+    return strategy
+
+def main(argv: Optional[List[str]] = None) -> None:
+    # Game options shared by every command
+    game_options = argparse.ArgumentParser(add_help=False)
+    game_options.add_argument("--deck-size", type=int, default=5, help="Number of cards in deck (3-13)")
+    game_options.add_argument("--max-raises", type=int, default=1, help="Maximum number of raises allowed (0-2)")
+    
+    parser = argparse.ArgumentParser(prog="one_card_limit", description="One Card Limit Poker")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    play_parser = commands.add_parser("play", parents=[game_options], 
+                                      help="Play One Card Limit Poker against the computer")
+    play_parser.add_argument("--hands", type=int, default=3, help="Number of hands to play")
+    play_parser.add_argument("--pace", type=float, default=0.0, 
+                             help="Scale of the pauses between game events in seconds, 0 for none")
+    
+    train_parser = commands.add_parser("train", parents=[game_options], help="Train and save a CFR strategy")
+    train_parser.add_argument("--iterations", type=int, default=10000, help="Number of CFR iterations")
+    
+    args = parser.parse_args(argv)
+    config = GameConfig(deck_size=args.deck_size, max_raises=args.max_raises)
+    if args.command == "play":
+        play(config, hands=args.hands, pace=args.pace)
+    else:
+        train(config, iterations=args.iterations)
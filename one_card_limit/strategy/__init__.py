@@ -1,11 +1,10 @@
 """
 Strategy implementations for One Card Limit Poker.
 """
+from .base_strategy import Strategy
+from .cfr_strategy import CFRStrategy
+
 __all__ = [
     'Strategy',
     'CFRStrategy',
-    'InfoState',
-    'GameNode',
-    'build_game_tree',
 ]
-
@@ -6,15 +6,29 @@ saving and loading strategies, and displaying the strategy.
 """
 
 # Standard Imports
+import json
 import random
-import pickle
+from collections import defaultdict
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
+# Third Party Imports
+import numpy as np
 # Local Imports
-from ..core.game_logic import Action, HandState, GameConfig, InfoState, generate_all_handstates
+from ..core.game_logic import ACTIONS, Action, Card, HandState, GameConfig, InfoState
+
+def get_strategy_path(config: GameConfig) -> Path:
+    """Returns the default file of the trained strategy for a game configuration."""
+    return _strategy_path(config.deck_size, config.max_raises)
+
+@lru_cache(maxsize=64)
+def _strategy_path(deck_size: int, max_raises: int) -> Path:
+    return Path(f"trained_strategies/cfr_strategy_d{deck_size}_r{max_raises}.npz").resolve()
 
 class Strategy:
-    def __init__(self, config: GameConfig, policy: Dict[InfoState, Dict[Action, float]] = None) -> None:
+    def __init__(self, config: GameConfig, policy: Optional[Dict[InfoState, Dict[Action, float]]] = None) -> None:
         self.config = config
         if policy is None:
             self.default_policy()
@@ -23,91 +37,175 @@ class Strategy:
         
     def get_action(self, state: HandState) -> Action:
         # Return random choice if no policy
-        if not self.policy:
+        if not self._policy:
             raise ValueError("No policy defined for strategy.")
         
-        # Get the info state for the acting player
-        info_state = state.get_info_state(state.acting_pos)
-        
-        # Get the action probabilities for this info state
-        action_probs = self.policy[info_state]
+        # Choose an action based on the cumulative probabilities for the acting player's info state
+        cum_probs = self._cum[self._key_id[state.info_key(state.acting_pos)]]
+        return ACTIONS[int(np.searchsorted(cum_probs, random.random(), side="right"))]
+    
+    def get_actions(self, states: Sequence[HandState]) -> List[Action]:
+        """Chooses an action for the acting player of each state, sampling all of them in one array operation."""
+        if not self._policy:
+            raise ValueError("No policy defined for strategy.")
         
-        # Choose an action based on the probabilities
-        return self.weighted_random_choice(action_probs)
+        rows = [self._key_id[state.info_key(state.acting_pos)] for state in states]
+        draws = np.array([random.random() for _ in rows])
+        # An action is chosen once the draw falls below its cumulative probability
+        choices = (self._cum[rows] <= draws[:, None]).sum(axis=1)
+        return [ACTIONS[choice] for choice in choices.tolist()]
+    
+    def get_strategy(self, info_state: InfoState) -> Mapping[Action, float]:
+        return self._policy[info_state]
+    
+    @property
+    def policy(self) -> Mapping[InfoState, Mapping[Action, float]]:
+        """Read-only view of the policy, assign a new policy to change it so the packed matrices stay in sync."""
+        return MappingProxyType(self._policy)
+    
+    @policy.setter
+    def policy(self, policy: Mapping[InfoState, Mapping[Action, float]]) -> None:
+        # Keep a read-only copy of each info state's probabilities, later changes to the given dicts don't reach it
+        self._policy: Dict[InfoState, Mapping[Action, float]] = {
+            info_state: MappingProxyType(dict(action_probs)) for info_state, action_probs in policy.items()
+        }
+        self._index_policy()
     
-    def get_strategy(self, info_state: InfoState) -> Dict[Action, float]:
-        return self.policy[info_state]
+    def _index_policy(self) -> None:
+        """
+        Packs the policy into a matrix with one row per info state and one column per action,
+        plus the cumulative probabilities used to sample actions.
+        """
+        self._id: Dict[InfoState, int] = {info_state: i for i, info_state in enumerate(self._policy)}
+        # Rows keyed by HandState.info_key, which hashes ints only
+        self._key_id: Dict[tuple, int] = {
+            (info_state.card.val, info_state.actions): i for info_state, i in self._id.items()
+        }
+        self._matrix = np.zeros((len(self._policy), len(ACTIONS)))
+        for info_state, action_probs in self._policy.items():
+            for action, prob in action_probs.items():
+                self._matrix[self._id[info_state], action] = prob
+        
+        # Rows without any probability are sampled uniformly over their valid actions
+        sampling = self._matrix.copy()
+        info_states = list(self._id)
+        for row in np.flatnonzero(sampling.sum(axis=1) <= 0).tolist():
+            valid_actions = list(info_states[row].valid_actions)
+            if not valid_actions:
+                raise ValueError(f"No valid actions or probabilities for info state {info_states[row]}")
+            sampling[row, valid_actions] = 1.0
+
+        # Normalize so every row ends at exactly 1 and rounding can't run past the last action
+        cum = np.cumsum(sampling, axis=1)
+        self._cum = cum / cum[:, -1:] if len(cum) else cum
    
     def show_policy(self) -> None:
-        """Display the policy in a readable format"""
+        """Display the policy in a readable format, one line per distinct action distribution."""
         print("=== Policy ===")
         
-        # Sort info states for better readability
-        sorted_items = sorted(
-            self.policy.items(),
-            key=lambda x: (str(x[0].card), str(x[0].actions))
-        )
+        # Group info states with the same valid actions whose probabilities match once rounded to 0.1%
+        groups: Dict[tuple, List[InfoState]] = defaultdict(list)
+        for info_state, row in zip(self._id, np.round(self._matrix, 3).tolist()):
+            groups[info_state.valid_actions, tuple(row)].append(info_state)
         
-        
-        for info_state, action_probs in sorted_items:
+        # Sort info states for better readability, building each sort key once
+        sort_keys = {info_state: (str(info_state.card), str(info_state.actions)) for info_state in self._id}
+        for members in groups.values():
+            members.sort(key=sort_keys.__getitem__)
+        for members in sorted(groups.values(), key=lambda members: sort_keys[members[0]]):
             action_str = ", ".join([
                 f"{action.name}: {prob:.1%}" 
-                for action, prob in action_probs.items()
+                for action, prob in self._policy[members[0]].items()
             ])
-            print(f"{info_state} -> {{{action_str}}}")
+            print(f"{{{action_str}}} <- {', '.join(map(str, members))}")
     
     def default_policy(self) -> None:
         """Initialize a default uniform random policy."""
-        self.policy = {}
-        all_handstates: List[HandState] = generate_all_handstates(self.config)
-        for handstate in all_handstates:
-            if handstate.is_over:
+        policy = {}
+        tree = self.config.build_tree()
+        deck = self.config.deck
+        for node, history in enumerate(tree.histories):
+            if tree.is_terminal[node]:
                 continue
-            info_state = handstate.get_info_state(handstate.acting_pos)
-            valid_actions = handstate.get_valid_actions()
+            valid_actions = tree.valid_actions(node)
             prob = 1.0 / len(valid_actions)
-            self.policy[info_state] = {action: prob for action in valid_actions}
+            for card in deck:
+                info_state = InfoState(
+                    pos = int(tree.acting_pos[node]),
+                    card = card,
+                    actions = history,
+                    valid_actions = valid_actions
+                )
+                policy[info_state] = {action: prob for action in valid_actions}
+        self.policy = policy
      
     @staticmethod
     def weighted_random_choice(action_probs: dict[Action, float]) -> Action:
         rnd = random.random()
         cumulative = 0.0
+        last_action = None
         for action, prob in action_probs.items():
             cumulative += prob
             if rnd < cumulative:
                 return action
-        return list(action_probs.keys())[-1]
+            last_action = action
+        # Probabilities summing to slightly under 1 leave the remainder to the last action
+        return last_action
     
     def save(self, filepath: str = None) -> None:
-        """Save strategy to a file."""
-        data = {
-            'config': self.config,
-            'policy': self.policy
-        }
+        """
+        Save strategy as a compressed NumPy archive of its policy matrix, keyed by game tree node and card,
+        with a JSON sidecar holding the game configuration. A given filepath gets the `.npz` suffix if it has none,
+        any other suffix is rejected.
+        """
         if filepath is None:
-            filepath = f"trained_strategies/cfr_strategy_d{self.config.deck_size}_r{self.config.max_raises}.pkl"
+            filepath = get_strategy_path(self.config)
+        else:
+            filepath = Path(filepath)
+            if filepath.suffix not in ("", ".npz"):
+                raise ValueError(f"Strategies are saved as .npz archives, got {filepath}")
+            filepath = filepath.with_suffix(".npz")
         # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        tree = self.config.build_tree()
+        nodes = np.array([tree.node_index[info_state.actions] for info_state in self._id], dtype=np.int32)
+        cards = np.array([info_state.card.val for info_state in self._id], dtype=np.int8)
+        np.savez_compressed(filepath, nodes=nodes, cards=cards, probs=self._matrix)
+        filepath.with_suffix(".json").write_text(json.dumps(asdict(self.config)))
     
     @classmethod
     def load(cls, config: GameConfig) -> 'Strategy':
-        """Create or load appropriate strategy."""
+        """
+        Create or load appropriate strategy. The saved strategy must have been trained for exactly this
+        configuration, ante included, otherwise the random strategy is used.
+        """
         try:
-            strategy_path = Path(f"trained_strategies/cfr_strategy_d{config.deck_size}_r{config.max_raises}.pkl")
+            strategy_path = get_strategy_path(config)
             if strategy_path.exists():
                 print(f"Loading existing CFR strategy from {strategy_path}")
-                with open(strategy_path, 'rb') as f:
-                    data = pickle.load(f)
-                    policy = data['policy']
-                    return cls(config=data['config'], policy=policy)
+                saved_config = GameConfig(**json.loads(strategy_path.with_suffix(".json").read_text()))
+                if saved_config != config:
+                    raise ValueError(f"Strategy was trained for {saved_config!r}, not {config!r}")
+                
+                with np.load(strategy_path) as data:
+                    nodes, cards, probs = data['nodes'], data['cards'], data['probs']
+                tree = saved_config.build_tree()
+                policy = {}
+                for node, card_val, row in zip(nodes.tolist(), cards.tolist(), probs):
+                    valid_actions = tree.valid_actions(node)
+                    info_state = InfoState(
+                        pos = int(tree.acting_pos[node]),
+                        card = Card(card_val),
+                        actions = tree.histories[node],
+                        valid_actions = valid_actions
+                    )
+                    policy[info_state] = {action: float(row[action]) for action in valid_actions}
+                return cls(config=saved_config, policy=policy)
             else:
                 print(f"No trained strategy found for {config}")
                 
-        except (ImportError, ModuleNotFoundError, pickle.UnpicklingError) as e:
+        except (OSError, KeyError, ValueError) as e:
             print(f"Error with CFR strategy: {e}")
             print("Using random strategy instead")
             return cls(config)
-
@@ -6,22 +6,66 @@ The `CFRStrategy` class can be instantiated with a `GameConfig` object and used
 """
 
 # Standard Imports 
-from typing import Dict
+from typing import Dict, List, Tuple
+# Third Party Imports
+import numpy as np
 # Local Imports
 from .base_strategy import Strategy
-from ..core.game_logic import Action, Card, GameConfig, HandState, InfoState
+from ..core.game_logic import Action, Card, GameConfig, GameTree, InfoState
 
 class CFRStrategy:
     """
     Implementation of Counterfactual Regret Minimization (CFR) for One Card Limit Poker.
+    
+    The betting tree does not depend on the cards dealt, so each iteration covers every deal
+    at once with reach probabilities and values carried as vectors over the cards in the deck.
+    The tree comes from `GameConfig.build_tree` as flat arrays indexed by node id, and every
+    node at the same depth is processed in one batch of array operations.
     """
     def __init__(self, config: GameConfig) -> None:
         self.config = config
         self.policy: Dict[InfoState, Dict[Action, float]] = {}
-        self.regret_sum: Dict[InfoState, Dict[Action, float]] = {}
-        self.strategy_sum: Dict[InfoState, Dict[Action, float]] = {}
+        self.deck: List[Card] = config.get_deck()
+        self.card_index: Dict[Card, int] = {card: i for i, card in enumerate(self.deck)}
         self.iterations = 0
         self.trained = False
+        
+        # Flat betting tree shared by every strategy with the same configuration
+        self.tree: GameTree = config.build_tree()
+        
+        # Regret and strategy sums shaped (num_nodes, deck_size, max_actions), 
+        # the valid actions of a node fill its first num_children columns
+        table_shape = (len(self.tree), len(self.deck), int(self.tree.num_children.max()))
+        self.regret_sum = np.zeros(table_shape)
+        self.strategy_sum = np.zeros(table_shape)
+        
+        # showdown_sign[i, j] is 1 if card i beats card j, -1 if it loses and 0 when i == j
+        card_vals = config.get_card_values().astype(np.int64)
+        self.showdown_sign = np.sign(card_vals[:, None] - card_vals[None, :])
+        
+        # Padded child indices and the mask of valid actions, shaped (num_nodes, max_actions)
+        tree = self.tree
+        action_slots = np.arange(table_shape[2])
+        self.valid_mask = action_slots[None, :] < tree.num_children[:, None]
+        self.child_index = np.where(self.valid_mask, tree.first_child[:, None] + action_slots[None, :], 0)
+        self.uniform_strategy = np.broadcast_to(
+            (self.valid_mask / np.maximum(tree.num_children, 1)[:, None])[:, None, :], table_shape
+        )
+        self.decision_nodes = np.flatnonzero(~tree.is_terminal)
+        self.showdown_nodes = np.flatnonzero(tree.showdown)
+        self.fold_nodes = np.flatnonzero(tree.is_terminal & ~tree.showdown)
+        
+        # Node ids grouped by depth, breadth first order keeps each depth contiguous
+        depth = np.zeros(len(tree), dtype=np.int32)
+        for node in range(1, len(tree)):
+            depth[node] = depth[tree.parent[node]] + 1
+        self.levels: List[np.ndarray] = [np.flatnonzero(depth == d) for d in range(depth.max() + 1)]
+        # Decision nodes of each depth, deepest first, with whether each player is the one acting there
+        self.decision_levels: List[Tuple[np.ndarray, np.ndarray]] = [
+            (level, (tree.acting_pos[level] == np.arange(2)[:, None])[:, :, None, None])
+            for level in (level[~tree.is_terminal[level]] for level in reversed(self.levels))
+            if len(level)
+        ]
     
     def train(self, iterations: int = 10000) -> Strategy:
         """
@@ -46,163 +90,120 @@ class CFRStrategy:
 
     def _cfr_iteration(self) -> None:
         """
-        Run one iteration of CFR training.
+        Run one iteration of CFR training over every possible deal.
         """
-        # Initialize reach probabilities for both players
-        op_reach_prob = 1.0
-        ip_reach_prob = 1.0
-        
-        # Create initial game state using factory method
-        initial_state = HandState(self.config, deal_cards=True)
-        
-        # Run CFR recursion
-        self._cfr_recursive(initial_state, op_reach_prob, ip_reach_prob)
-
-    def _cfr_recursive(self, state: HandState, op_reach: float, ip_reach: float) -> Dict[int, float]:
-        """ Recursive CFR implementation. Returns expected values for each player."""
-        
-        if state.is_over:
-            # Terminal state, return utility values
-            utilities = {
-                i : state.stacks[i] 
-                for i in [0, 1]
-            }
-            return utilities
-
-        player = state.acting_pos
-        info_state = state.get_info_state(state.acting_pos)
-        
-        # If this is a new info state, initialize policy
-        if info_state not in self.policy:
-            valid = info_state.valid_actions
-            self.policy[info_state] = {action : 1/len(valid) for action in valid}
-            
-        if info_state not in self.regret_sum:
-            self.regret_sum[info_state] = {
-                action: 0.0 for action in self.policy[info_state].keys()
-            }
-            
-        if info_state not in self.strategy_sum:
-            self.strategy_sum[info_state] = {
-                action: 0.0 for action in self.policy[info_state].keys()
-            }
-        
-        # Get current strategy through regret matching
-        strategy = self.get_strategy(info_state)
-        
-        # Initialize action values and node value
-        action_values: Dict[Action, float] = {}
-        node_value = {0: 0.0, 1: 0.0}  # Expected value for each player
-        
-        # Recursively evaluate each action
-        for action in self.policy[info_state].keys():
-            # Create new state after taking action
-            new_state = state.clone()
-            new_state.process_action(action)
-            
-            # Update reach probabilities
-            if player == 0:  # OP
-                action_reach = op_reach * strategy[action]
-                child_values = self._cfr_recursive(new_state, action_reach, ip_reach)
-            else:  # IP
-                action_reach = ip_reach * strategy[action]
-                child_values = self._cfr_recursive(new_state, op_reach, action_reach)
-            
-            action_values[action] = child_values[player]
-            for p in [0, 1]:
-                node_value[p] += strategy[action] * child_values[p]
-
-        # Compute counterfactual regrets and update
-        if player == 0:
-            reach_prob = ip_reach
-        else:
-            reach_prob = op_reach
-            
-        for action in action_values:
-            regret = reach_prob * (action_values[action] - node_value[player])
-            self.update_regrets(info_state, action, regret)
-            
-        return node_value
+        strategy = self._current_strategy()
+        reach = self._reach_probabilities(strategy)
+        values = self._counterfactual_values(strategy, reach)
+        
+        # Counterfactual values are weighted by the opponent's reach, so regrets need no extra factor
+        nodes = self.decision_nodes
+        players = self.tree.acting_pos[nodes]
+        action_values = values[players[:, None], self.child_index[nodes]].transpose(0, 2, 1)
+        node_values = values[players, nodes]
+        self.regret_sum[nodes] += self.valid_mask[nodes][:, None, :] * (action_values - node_values[:, :, None])
+        
+        # Average strategy is weighted by the acting player's own reach
+        self.strategy_sum[nodes] += reach[players, nodes][:, :, None] * strategy[nodes]
+    
+    def _current_strategy(self) -> np.ndarray:
+        """
+        Regret matching at every node, shaped (num_nodes, deck_size, max_actions) with zeros for invalid actions.
+        """
+        return self._regret_matching(self.regret_sum, self.uniform_strategy)
+    
+    def _reach_probabilities(self, strategy: np.ndarray) -> np.ndarray:
+        """
+        Top down pass for each player's probability of reaching every node with every card, 
+        shaped (2, num_nodes, deck_size).
+        """
+        tree = self.tree
+        reach = np.ones((2, len(tree), len(self.deck)))
+        for level in self.levels[1:]:
+            parents = tree.parent[level]
+            actions = level - tree.first_child[parents]
+            reach[:, level] = reach[:, parents]
+            # Only the player who acted at the parent changes their reach
+            reach[tree.acting_pos[parents], level] *= strategy[parents, :, actions]
+        return reach
+    
+    def _counterfactual_values(self, strategy: np.ndarray, reach: np.ndarray) -> np.ndarray:
+        """
+        Bottom up pass for each player's counterfactual value at every node for every card they could hold, 
+        shaped (2, num_nodes, deck_size).
+        """
+        tree = self.tree
+        values = np.zeros_like(reach)
+        
+        # Each player put half the pot in at showdown, the better card wins the other half
+        nodes = self.showdown_nodes
+        utility = tree.terminal_utility[nodes][:, None]
+        values[:, nodes] = utility * (reach[::-1, nodes] @ self.showdown_sign.T)
+        
+        # After a fold the payoff does not depend on the cards, 
+        # the opponent can hold any card except the player's own
+        nodes = self.fold_nodes
+        utility = tree.terminal_utility[nodes][:, None] * np.array([1.0, -1.0])[:, None, None]
+        opponent_reach = reach[::-1, nodes]
+        values[:, nodes] = utility * (opponent_reach.sum(axis=2, keepdims=True) - opponent_reach)
+        
+        for level, acting in self.decision_levels:
+            # The acting player weights children by their strategy, the opponent's values 
+            # already account for those action probabilities through the reach
+            weights = np.where(acting, strategy[level].transpose(0, 2, 1), self.valid_mask[level][:, :, None])
+            values[:, level] = (weights * values[:, self.child_index[level]]).sum(axis=2)
+        return values
 
     def calculate_ev(self, card: Card, position: int) -> float:
         """
         Calculate expected value for a specific card and position.
         """
-        ev = 0.0
-        iterations = 1000  # Number of iterations for Monte Carlo simulation
-        cards = [None, None]
-        cards[position] = card
-        
-        for _ in range(iterations):
-            # Create new hand with the specified card and position
-            state = HandState.from_cards(self.config, cards)
-            
-            # Get values using current strategy
-            values = self._cfr_recursive(state, 1.0, 1.0)
-            ev += values[position]
-            
-        return ev / iterations
+        values = self._evaluate()
+        return float(values[position][self.card_index[card]])
 
     def calculate_ev_matrix(self) -> Dict[str, Dict[Card, float]]:
         """
         Calculate EV matrix for all possible starting hands and positions.
         """
+        op_values, ip_values = self._evaluate()
         ev_matrix = {
-            'OP': {},
-            'IP': {}
+            'OP': {card: float(op_values[i]) for i, card in enumerate(self.deck)},
+            'IP': {card: float(ip_values[i]) for i, card in enumerate(self.deck)}
         }
-        
-        deck = self.config.get_deck()
-        # Generate all possible cards in the deck
-        for card in deck:
-            ev_matrix['OP'][card] = self.calculate_ev(card, 0)
-            ev_matrix['IP'][card] = self.calculate_ev(card, 1)
-            
         return ev_matrix
     
-    def update_regrets(self, info_state: InfoState, action: Action, regret: float) -> None:
+    def _evaluate(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Update regret sums and strategy sums for the given info state and action.
-        
-        Args:
-            info_state: The information state
-            action: The action taken
-            regret: The counterfactual regret value
+        Expected value of each card for both positions under the current strategy, 
+        averaged over the opponent's possible cards.
         """
-        # Update regret sum
-        self.regret_sum[info_state][action] += regret
-        
-        # Get current strategy for this info state
-        strategy = self.get_strategy(info_state)
-        
-        # Update strategy sum - accumulate the current strategy
-        for a, prob in strategy.items():
-            self.strategy_sum[info_state][a] += prob  
+        strategy = self._current_strategy()
+        values = self._counterfactual_values(strategy, self._reach_probabilities(strategy))
+        num_opponent_cards = len(self.deck) - 1
+        return values[0, 0] / num_opponent_cards, values[1, 0] / num_opponent_cards
     
     def get_strategy(self, info_state: InfoState) -> Dict[Action, float]:       
         """
         Get current strategy for the given info state using regret matching.
         """
-        strategy = {}
-        regret_sum = self.regret_sum[info_state]
-        
+        node = self.tree.node_index[info_state.actions]
+        valid = self.tree.valid_actions(node)
+        regrets = self.regret_sum[node, self.card_index[info_state.card], :len(valid)]
+        row = self._regret_matching(regrets, np.full(len(valid), 1.0 / len(valid)))
+        return dict(zip(valid, row.tolist()))
+    
+    @staticmethod
+    def _regret_matching(regret_sum: np.ndarray, uniform: np.ndarray) -> np.ndarray:
+        """
+        Normalize positive regrets over the last axis into a strategy, 
+        falling back to the given uniform strategy where no regret is positive.
+        """
         # Sum positive regrets
-        normalizing_sum = 0
-        for action in self.policy[info_state].keys():
-            strategy[action] = max(0, regret_sum[action])
-            normalizing_sum += strategy[action]
-            
-        # Normalize probabilities
-        if normalizing_sum > 0:
-            for action in strategy:
-                strategy[action] /= normalizing_sum
-        else:
-            # If all regrets are negative or zero, use uniform strategy
-            action_count = len(self.policy[info_state])
-            for action in self.policy[info_state].keys():
-                strategy[action] = 1.0 / action_count
-        
-        return strategy
+        positive_regrets = np.maximum(regret_sum, 0.0)
+        normalizing_sum = positive_regrets.sum(axis=-1, keepdims=True)
+        
+        # Normalize probabilities, if all regrets are negative or zero use a uniform strategy
+        return np.divide(positive_regrets, normalizing_sum, out=np.array(uniform, dtype=float), where=normalizing_sum > 0)
 
     def get_average_strategy(self) -> Dict[InfoState, Dict[Action, float]]:
         """
@@ -210,18 +211,23 @@ class CFRStrategy:
         """
         avg_strategy = {}
         
-        for info_state, strategy_sum in self.strategy_sum.items():
-            avg_strategy[info_state] = {}
-            normalizing_sum = sum(strategy_sum.values())
+        for node, history in enumerate(self.tree.histories):
+            if self.tree.is_terminal[node]:
+                continue
+            valid = self.tree.valid_actions(node)
+            strategy_sum = self.strategy_sum[node, :, :len(valid)]
+            normalizing_sum = strategy_sum.sum(axis=1, keepdims=True)
+            # If a card never reached this history, use uniform
+            uniform = np.full_like(strategy_sum, 1.0 / len(valid))
+            avg = np.divide(strategy_sum, normalizing_sum, out=uniform, where=normalizing_sum > 0)
             
-            if normalizing_sum > 0:
-                for action, sum_prob in strategy_sum.items():
-                    avg_strategy[info_state][action] = sum_prob / normalizing_sum
-            
-            else:
-                # If no accumulated strategy (shouldn't happen), use uniform
-                action_count = len(self.policy[info_state])
-                for action in self.policy[info_state].keys():
-                    avg_strategy[info_state][action] = 1.0 / action_count
-        
-        return avg_strategy
\ No newline at end of file
+            for i, card in enumerate(self.deck):
+                info_state = InfoState(
+                    pos = int(self.tree.acting_pos[node]),
+                    card = card,
+                    actions = history,
+                    valid_actions = valid
+                )
+                avg_strategy[info_state] = dict(zip(valid, avg[i].tolist()))
+        
+        return avg_strategy
@@ -1,6 +1,8 @@
 """
 Utility functions and logging for One Card Limit Poker.
 """
+from .logger import GameLogger
+
 __all__ = [
     'GameLogger',
-]
\ No newline at end of file
+]
@@ -14,22 +14,28 @@ class GameLogger:
     """
     Handles logging of game events
     """
-    def __init__(self, initial_stack: int) -> None:
+    # Display names of the out of position and in position players, indexed by position
+    POSITION_NAMES = ("OP", "IP")
+    
+    def __init__(self, initial_stack: int, pace: float = 0.0) -> None:
+        """`pace` scales the pauses between events for interactive play, by default there are none."""
         self.initial_stack = initial_stack
         self.human_starting_stack = initial_stack
         self.computer_starting_stack = initial_stack
+        self.pace = pace
 
     def _delay(self, seconds: int = 1) -> None:
-        """Add a delay for better readability."""
-        sleep(seconds)
+        """Add a delay for better readability, scaled by pace. A pace of 0 disables delays."""
+        if self.pace:
+            sleep(seconds * self.pace)
 
     def _format_action_message(self, state: HandState) -> str:
         """Format the message for the last action taken."""
         if not state.actions:
             return ""
         last_action = state.actions[-1]
-        last_action_name = last_action.value.capitalize()
-        last_player_name = ["OP", "IP"][(state.acting_pos + 1) % 2]
+        last_action_name = last_action.name.capitalize()
+        last_player_name = self.POSITION_NAMES[(state.acting_pos + 1) % 2]
         msg = f"{last_player_name} {last_action_name}s"
         if last_action in [Action.RAISE, Action.BET]:
             msg += f" to {state.current_bet}"
@@ -48,7 +54,7 @@ class GameLogger:
 
     def log_hand_header(self, hand_num: int, total_hands: int, human_pos: int) -> None:
         print(f"\n--- Hand {hand_num}/{total_hands} ---")
-        print(f"You are {'IP' if human_pos == 1 else 'OP'}")
+        print(f"You are {self.POSITION_NAMES[human_pos]}")
     
     def log_hand_start(self) -> None:
         print("Cards dealt, Antes Posted")
@@ -61,13 +67,12 @@ class GameLogger:
         if state.is_over:
             if state.showdown:
                 print("Showdown:")
-                for card in state.cards:
+                for player_name, card in zip(self.POSITION_NAMES, state.cards):
                     self._delay(2)
-                    player_name = ["OP", "IP"]
                     print(f"{player_name} shows: {card}")
             if state.winner_pos is not None:
                 self._delay(1)
-                winner_name = ["OP","IP"][state.winner_pos]
+                winner_name = self.POSITION_NAMES[state.winner_pos]
                 print(f"{winner_name} wins {state.pot}")
         self._delay(1)
         print("Hand over")